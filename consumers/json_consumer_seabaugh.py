@@ -20,6 +20,7 @@ Example JSON message (after deserialization) to be analyzed
 # Import packages from Python Standard Library
 import os
 import json  # handle JSON parsing
+import threading  # consume on a background thread
 from collections import defaultdict  # data structure for counting author occurrences
 
 # Import external packages
@@ -60,6 +61,34 @@ def get_kafka_consumer_group_id() -> str:
     return group_id
 
 
+def get_mpl_backend() -> str:
+    """Fetch matplotlib backend from environment, then MPLBACKEND, or use default."""
+    backend: str = os.getenv("BUZZ_MPL_BACKEND") or os.getenv("MPLBACKEND") or "TkAgg"
+    logger.info(f"Matplotlib backend: {backend}")
+    return backend
+
+
+def get_fetch_min_bytes() -> int:
+    """Fetch minimum bytes per Kafka fetch from environment or use default."""
+    fetch_min_bytes: int = int(os.getenv("BUZZ_FETCH_MIN_BYTES", 65536))
+    logger.info(f"Kafka fetch min bytes: {fetch_min_bytes}")
+    return fetch_min_bytes
+
+
+def get_fetch_max_wait_ms() -> int:
+    """Fetch maximum Kafka fetch wait in milliseconds from environment or use default."""
+    fetch_max_wait_ms: int = int(os.getenv("BUZZ_FETCH_MAX_WAIT_MS", 200))
+    logger.info(f"Kafka fetch max wait (ms): {fetch_max_wait_ms}")
+    return fetch_max_wait_ms
+
+
+def get_max_poll_records() -> int:
+    """Fetch maximum records per Kafka poll from environment or use default."""
+    max_poll_records: int = int(os.getenv("BUZZ_MAX_POLL_RECORDS", 500))
+    logger.info(f"Kafka max poll records: {max_poll_records}")
+    return max_poll_records
+
+
 #####################################
 # Set up data structures
 #####################################
@@ -67,58 +96,82 @@ def get_kafka_consumer_group_id() -> str:
 # Initialize a dictionary to store author counts
 author_counts = defaultdict(int)
 
+# The consumer thread updates author_counts while the main thread
+# redraws the chart, so guard the counts with a lock
+counts_lock = threading.Lock()
+stop_event = threading.Event()
+
+# Redraw the chart at most every PLOT_INTERVAL_SECONDS,
+# and only if messages arrived since the last redraw
+PLOT_INTERVAL_SECONDS = 0.5
+POLL_TIMEOUT_MS = 500
+
+_msgs_since_draw = 0
+
 #####################################
 # Set up live visuals
 #####################################
 
+# Prefer a fast Agg-based GUI backend (see BUZZ_MPL_BACKEND in the README)
+try:
+    plt.switch_backend(get_mpl_backend())
+except ImportError as e:
+    logger.warning(f"Keeping default matplotlib backend: {e}")
+
 # Use the subplots() method to create a tuple containing
 # two objects at once:
 # - a figure (which can have many axis)
 # - an axis (what they call a chart in Matplotlib)
-fig, ax = plt.subplots()
+# Use the constrained layout engine to adjust the padding as author names
+# are added, instead of calling tight_layout() on every update
+fig, ax = plt.subplots(layout="constrained")
+
+# Use the built-in axes methods to set the labels and title once,
+# since update_chart() updates the bars without clearing the axes
+ax.set_xlabel("Authors")
+ax.set_ylabel("Message Counts")
+ax.set_title("Clayton's Real-Time Author Message Counts")
+
+# Keep one persistent bar (a Rectangle) per author
+author_bars = {}
 
 # Use the ion() method (stands for "interactive on")
 # to turn on interactive mode for live updates
 plt.ion()
 
+
 #####################################
 # Define an update chart function for live plotting
-# This will get called every time a new message is processed
+# This will get called by refresh_chart() on the main thread
+# every PLOT_INTERVAL_SECONDS while new messages are arriving
 #####################################
 
 
 def update_chart():
     """Update the live chart with the latest author counts."""
-    # Clear the previous chart
-    ax.clear()
-
-    # Get the authors and counts from the dictionary
-    authors_list = list(author_counts.keys())
-    counts_list = list(author_counts.values())
-
-    # Create a bar chart using the bar() method.
-    # Pass in the x list, the y list, and the color
-    ax.bar(authors_list, counts_list, color="skyblue")
-
-    # Use the built-in axes methods to set the labels and title
-    ax.set_xlabel("Authors")
-    ax.set_ylabel("Message Counts")
-    ax.set_title("Clayton's Real-Time Author Message Counts")
+    # Update the height of each author's bar, adding a bar
+    # with the bar() method the first time an author appears
+    new_author = False
+    for author, count in author_counts.items():
+        if author in author_bars:
+            author_bars[author].set_height(count)
+        else:
+            author_bars[author] = ax.bar(author, count, color="skyblue")[0]
+            new_author = True
 
-    # Use the set_xticklabels() method to rotate the x-axis labels
-    # Pass in the x list, specify the rotation angle is 45 degrees,
-    # and align them to the right
+    # Only touch the x-axis labels when a new author adds a label.
+    # Rotate them 45 degrees and align them to the right
     # ha stands for horizontal alignment
-    ax.set_xticklabels(authors_list, rotation=45, ha="right")
+    if new_author:
+        plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
 
-    # Use the tight_layout() method to automatically adjust the padding
-    plt.tight_layout()
+    # Rescale the axes to fit the new bar heights
+    ax.relim()
+    ax.autoscale_view()
 
-    # Draw the chart
-    plt.draw()
-
-    # Pause briefly to allow some time for the chart to render
-    plt.pause(0.01)
+    # Schedule a redraw for when the GUI event loop is next idle,
+    # so several updates in one burst collapse into a single draw
+    fig.canvas.draw_idle()
 
 
 #####################################
@@ -126,12 +179,15 @@ def update_chart():
 # #####################################
 
 
-def process_message(message: str) -> None:
+def process_message(message: str) -> bool:
     """
-    Process a single JSON message from Kafka and update the chart.
+    Process a single JSON message from Kafka and update the author counts.
 
     Args:
         message (str): The JSON message as a string.
+
+    Returns:
+        bool: True if the author counts changed.
     """
     try:
         # Log the raw message for debugging
@@ -152,14 +208,13 @@ def process_message(message: str) -> None:
             # Increment the count for the author
             author_counts[author] += 1
 
-            # Log the updated counts
-            logger.info(f"Updated author counts: {dict(author_counts)}")
+            # Log the updated counts at DEBUG level; lazy=True means the
+            # dict copy is only built if DEBUG messages are being logged
+            logger.opt(lazy=True).debug(
+                "Updated author counts: {}", lambda: dict(author_counts)
+            )
 
-            # Update the chart
-            update_chart()
-
-            # Log the updated chart
-            logger.info(f"Chart updated successfully for message: {message}")
+            return True
         else:
             logger.error(f"Expected a dictionary but got: {type(message_dict)}")
 
@@ -167,6 +222,42 @@ def process_message(message: str) -> None:
         logger.error(f"Invalid JSON message: {message}")
     except Exception as e:
         logger.error(f"Error processing message: {e}")
+    return False
+
+
+def consume_messages(consumer) -> None:
+    """Poll Kafka on a background thread and update the author counts."""
+    global _msgs_since_draw
+    try:
+        while not stop_event.is_set():
+            batches = consumer.poll(timeout_ms=POLL_TIMEOUT_MS)
+            for records in batches.values():
+                for message in records:
+                    # message is a complex object with metadata and value
+                    # Use the value attribute to extract the message as a string
+                    message_str = message.value
+                    logger.debug(f"Received message at offset {message.offset}: {message_str}")
+                    with counts_lock:
+                        if process_message(message_str):
+                            _msgs_since_draw += 1
+    except Exception as e:
+        logger.error(f"Error while consuming messages: {e}")
+    finally:
+        consumer.close()
+
+
+def refresh_chart() -> None:
+    """Redraw the chart on the main thread if new messages arrived since the last redraw."""
+    global _msgs_since_draw
+    with counts_lock:
+        if not _msgs_since_draw:
+            return
+        _msgs_since_draw = 0
+        # Log errors instead of raising, since an exception would stop the timer
+        try:
+            update_chart()
+        except Exception as e:
+            logger.error(f"Error updating chart: {e}")
 
 
 #####################################
@@ -180,7 +271,8 @@ def main() -> None:
 
     - Reads the Kafka topic name and consumer group ID from environment variables.
     - Creates a Kafka consumer using the `create_kafka_consumer` utility.
-    - Polls messages and updates a live chart.
+    - Polls messages on a background thread and updates a live chart
+      from a timer on the main thread until the window is closed.
     """
     logger.info("START consumer.")
 
@@ -190,23 +282,47 @@ def main() -> None:
     logger.info(f"Consumer: Topic '{topic}' and group '{group_id}'...")
 
     # Create the Kafka consumer using the helpful utility function.
-    consumer = create_kafka_consumer(topic, group_id)
-
-    # Poll and process messages
+    # Fetch larger batches per request to spread the per-fetch overhead
+    consumer = create_kafka_consumer(
+        topic,
+        group_id,
+        fetch_min_bytes=get_fetch_min_bytes(),
+        fetch_max_wait_ms=get_fetch_max_wait_ms(),
+        max_poll_records=get_max_poll_records(),
+    )
+
+    # Poll and process messages on a background thread,
+    # so redrawing the chart never blocks polling
     logger.info(f"Polling messages from topic '{topic}'...")
+    consumer_thread = threading.Thread(target=consume_messages, args=(consumer,), daemon=True)
+    consumer_thread.start()
+
+    # Redraw from a GUI timer so matplotlib is only used on the main thread
+    timer = fig.canvas.new_timer(interval=int(PLOT_INTERVAL_SECONDS * 1000))
+    timer.add_callback(refresh_chart)
+    timer.start()
+
     try:
-        for message in consumer:
-            # message is a complex object with metadata and value
-            # Use the value attribute to extract the message as a string
-            message_str = message.value
-            logger.debug(f"Received message at offset {message.offset}: {message_str}")
-            process_message(message_str)
+        if type(fig.canvas).required_interactive_framework is None:
+            # plt.show() returns at once on non-interactive backends (such as
+            # Agg with no display), so keep consuming until interrupted
+            logger.warning(
+                f"Matplotlib backend '{plt.get_backend()}' is not interactive; "
+                "consuming without a live chart"
+            )
+            while consumer_thread.is_alive():
+                consumer_thread.join(timeout=PLOT_INTERVAL_SECONDS)
+        else:
+            # Turn off interactive mode and display the chart,
+            # which keeps the final counts on screen until the window is closed
+            plt.ioff()
+            plt.show()
     except KeyboardInterrupt:
         logger.warning("Consumer interrupted by user.")
-    except Exception as e:
-        logger.error(f"Error while consuming messages: {e}")
     finally:
-        consumer.close()
+        timer.stop()
+        stop_event.set()
+        consumer_thread.join()
         logger.info(f"Kafka consumer for topic '{topic}' closed.")
 
     logger.info(f"END consumer for topic '{topic}' and group '{group_id}'.")
@@ -220,9 +336,3 @@ if __name__ == "__main__":
 
     # Call the main function to start the consumer
     main()
-
-    # Turn off interactive mode after completion
-    plt.ioff()  
-
-    # Display the final chart
-    plt.show()
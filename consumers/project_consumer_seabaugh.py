@@ -1,5 +1,5 @@
 """
-json_consumer_seabaugh.py
+project_consumer_seabaugh.py
 
 Real-Time Kafka Consumer with Analytics and Visualization
 
@@ -15,13 +15,33 @@ Example JSON message:
 
 import os
 import json
-from collections import defaultdict
-from datetime import datetime
+import math
+import re
+import threading
+import time
+from collections import Counter, deque
+from functools import lru_cache
 
 import nltk
+import numpy as np
 from nltk.sentiment import SentimentIntensityAnalyzer
 from dotenv import load_dotenv
 import matplotlib.pyplot as plt
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+
+# Import orjson, a faster C JSON parser, only if available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Import the C-implemented Aho-Corasick automaton only if available
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from utils.utils_consumer import create_kafka_consumer
 from utils.utils_logger import logger
@@ -30,9 +50,17 @@ from utils.utils_logger import logger
 # NLTK Setup
 #####################################
 
-nltk.download('vader_lexicon')
+# Download the VADER lexicon only if it is not installed yet,
+# so normal startup does no network I/O
+try:
+    nltk.data.find('sentiment/vader_lexicon.zip')
+except LookupError:
+    nltk.download('vader_lexicon')
 sia = SentimentIntensityAnalyzer()
 
+# Longest message text passed to VADER
+MAX_SENTIMENT_CHARS = 2000
+
 #####################################
 # Load Environment Variables
 #####################################
@@ -51,104 +79,345 @@ def get_kafka_consumer_group_id() -> str:
     """Fetch Kafka consumer group id from environment or use default."""
     return os.getenv("BUZZ_CONSUMER_GROUP_ID", "default_group")
 
+def get_mpl_backend() -> str:
+    """Fetch matplotlib backend from environment, then MPLBACKEND, or use default."""
+    return os.getenv("BUZZ_MPL_BACKEND") or os.getenv("MPLBACKEND") or "TkAgg"
+
+def get_fetch_min_bytes() -> int:
+    """Fetch minimum bytes per Kafka fetch from environment or use default."""
+    return int(os.getenv("BUZZ_FETCH_MIN_BYTES", 65536))
+
+def get_fetch_max_wait_ms() -> int:
+    """Fetch maximum Kafka fetch wait in milliseconds from environment or use default."""
+    return int(os.getenv("BUZZ_FETCH_MAX_WAIT_MS", 200))
+
+def get_max_poll_records() -> int:
+    """Fetch maximum records per Kafka poll from environment or use default."""
+    return int(os.getenv("BUZZ_MAX_POLL_RECORDS", 500))
+
 #####################################
 # Data Structures for Analytics
 #####################################
 
-sentiment_counts = defaultdict(int)
-message_timestamps = []
+# Counts per sentiment label, stored in a fixed array indexed by _SENT_IDX
+_SENT_IDX = {'positive': 0, 'neutral': 1, 'negative': 2}
+sentiment_counts = np.zeros(len(_SENT_IDX), dtype=np.int64)
+
+# Messages per minute, keyed by minutes since the epoch, for the most
+# recent VOLUME_WINDOW_MINUTES minutes (oldest first in volume_order)
+VOLUME_WINDOW_MINUTES = 60
+volume_by_min = Counter()
+volume_order = deque()
+
 keywords = ['Kafka', 'Python', 'data', 'real-time', 'analysis']
-keyword_counts = defaultdict(int)
+# Counts per keyword, stored in a fixed array in the same order as keywords
+keyword_counts = np.zeros(len(keywords), dtype=np.int64)
+
+# Keywords lowercased once, to match against lowercased message text
+_KW_LOWER = [kw.lower() for kw in keywords]
+
+# One pre-compiled pattern matching any keyword as a whole word,
+# plus a lookup from the matched keyword to its index
+_KW_RE = re.compile(r"\b(" + "|".join(map(re.escape, _KW_LOWER)) + r")\b")
+_KW_IDX = {kw: i for i, kw in enumerate(_KW_LOWER)}
+
+# When available, an Aho-Corasick automaton finds all keywords in one pass
+# over the lowercased text no matter how many keywords there are
+if AHOCORASICK_AVAILABLE:
+    _KW_AUTOMATON = ahocorasick.Automaton()
+    for i, kw in enumerate(_KW_LOWER):
+        _KW_AUTOMATON.add_word(kw, (len(kw), i))
+    _KW_AUTOMATON.make_automaton()
+
+#####################################
+# Threading and Redraw Timing
+#####################################
+
+# Kafka is consumed on a background thread while matplotlib stays on the
+# main thread. The lock guards the analytics data both threads share.
+analytics_lock = threading.Lock()
+stop_event = threading.Event()
+
+# Redraw at most this often, and only if new messages arrived
+PLOT_INTERVAL_SECONDS = 0.5
+_msgs_since_draw = 0
+
+# Batch size and wait time for each Kafka poll
+POLL_TIMEOUT_MS = 500
+POLL_MAX_RECORDS = get_max_poll_records()
 
 #####################################
 # Set Up Live Visualization
 #####################################
 
-fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 12))
+# Prefer a fast Agg-based GUI backend (see BUZZ_MPL_BACKEND in the README)
+try:
+    plt.switch_backend(get_mpl_backend())
+except ImportError as e:
+    logger.warning(f"Keeping default matplotlib backend: {e}")
+
+# The constrained layout engine keeps the rotated tick labels from
+# overlapping without calling tight_layout() on every redraw
+fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 12), layout='constrained')
+
+# Create the chart artists once and update them in place. They are
+# marked animated so full draws skip them and they can be blitted alone.
+
+# Sentiment Pie Chart (hidden until the first message arrives)
+sentiment_labels = ['Positive', 'Neutral', 'Negative']
+wedges, wedge_labels, wedge_pcts = ax1.pie(
+    [1, 1, 1], labels=sentiment_labels, autopct='%1.1f%%',
+    colors=['#4CAF50', '#FFEB3B', '#F44336'])
+ax1.set_title('Real-Time Sentiment Analysis')
+sentiment_artists = [*wedges, *wedge_labels, *wedge_pcts]
+for artist in sentiment_artists:
+    artist.set_animated(True)
+    artist.set_visible(False)
+
+# Message Volume Line Chart (x values are minutes since the epoch)
+def format_minute(minute, pos=None) -> str:
+    """Format minutes since the epoch as a local HH:MM tick label."""
+    return time.strftime('%H:%M', time.localtime(minute * 60))
+
+line_volume, = ax2.plot([], [], marker='o', linestyle='-', color='#2196F3',
+                        animated=True)
+ax2.xaxis.set_major_locator(MaxNLocator(integer=True, min_n_ticks=1))
+ax2.xaxis.set_major_formatter(FuncFormatter(format_minute))
+ax2.set_title('Message Volume Over Time')
+ax2.set_ylabel('Messages per Minute')
+plt.setp(ax2.get_xticklabels(), rotation=45, ha='right')
+
+# Keyword Frequency Bar Chart
+bars_kw = ax3.bar(keywords, [0] * len(keywords), color='#9C27B0')
+for rect in bars_kw:
+    rect.set_animated(True)
+ax3.set_title('Keyword Frequency Tracking')
+ax3.set_ylabel('Count')
+plt.setp(ax3.get_xticklabels(), rotation=45, ha='right')
+
 plt.ion()
+plt.show(block=False)
 
 #####################################
-# Visualization Update Function
+# Blitting Support
 #####################################
 
+# Figure background (everything except the animated artists), captured
+# after every full draw. It covers the whole figure rather than each axes,
+# because the pie labels extend past the edges of their axes.
+background = None
+
+def draw_animated_artists() -> None:
+    """Draw the animated chart artists onto the canvas."""
+    for artist in sentiment_artists:
+        ax1.draw_artist(artist)
+    ax2.draw_artist(line_volume)
+    for rect in bars_kw:
+        ax3.draw_artist(rect)
+
+def on_draw(event) -> None:
+    """Capture a clean figure background after a full draw, then draw the animated artists."""
+    global background
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+    draw_animated_artists()
+
+# Canvases that cannot blit draw the chart artists as part of every full draw
+if fig.canvas.supports_blit:
+    fig.canvas.mpl_connect('draw_event', on_draw)
+else:
+    for artist in (*sentiment_artists, line_volume, *bars_kw):
+        artist.set_animated(False)
+
+def grow_ylim(axes, top: float) -> bool:
+    """Raise the y-axis limit with headroom when data outgrows it. Returns True if it changed."""
+    if top < axes.get_ylim()[1]:
+        return False
+    axes.set_ylim(0, top * 1.5)
+    return True
+
+#####################################
+# Visualization Update Functions
+#####################################
+
+def update_sentiment_chart() -> None:
+    """Resize the sentiment pie wedges and move their labels."""
+    total = sentiment_counts.sum()
+    if not total:
+        return
+
+    fractions = sentiment_counts / total
+    edges = np.concatenate(([0.0], np.cumsum(fractions) * 360.0))
+    for wedge, label, pct, theta1, theta2, fraction in zip(
+            wedges, wedge_labels, wedge_pcts, edges[:-1], edges[1:], fractions):
+        wedge.set_theta1(theta1)
+        wedge.set_theta2(theta2)
+
+        # Place the label and percentage the same way ax.pie() does
+        mid = math.radians((theta1 + theta2) / 2)
+        x, y = math.cos(mid), math.sin(mid)
+        label.set_position((1.1 * x, 1.1 * y))
+        label.set_horizontalalignment('left' if x > 0 else 'right')
+        pct.set_position((0.6 * x, 0.6 * y))
+        pct.set_text(f'{100.0 * fraction:.1f}%')
+
+        wedge.set_visible(fraction > 0)
+        label.set_visible(fraction > 0)
+        pct.set_visible(fraction > 0)
+
+def update_message_volume() -> bool:
+    """Update the message volume line. Returns True if the axes limits changed."""
+    if not volume_order:
+        return False
+
+    # Spread the sparse per-minute counts into a dense array with one
+    # vectorized bincount, so minutes without messages plot as zero.
+    # The minute buckets are plotted as plain integers; only the visible
+    # tick labels are formatted as times, by format_minute().
+    n = len(volume_order)
+    minutes = np.fromiter(volume_order, dtype=np.int64, count=n)
+    weights = np.fromiter((volume_by_min[m] for m in volume_order), dtype=np.int64, count=n)
+    base = minutes[0]
+    counts = np.bincount(minutes - base, weights=weights)
+    xs = np.arange(base, base + counts.size)
+    line_volume.set_data(xs, counts)
+
+    old_xlim = ax2.get_xlim()
+    ax2.set_xlim(xs[0] - 0.5, xs[-1] + 0.5)
+    rescaled = grow_ylim(ax2, counts.max())
+    return rescaled or ax2.get_xlim() != old_xlim
+
+def update_keyword_chart() -> bool:
+    """Update the keyword bar heights. Returns True if the axes limits changed."""
+    for rect, count in zip(bars_kw, keyword_counts):
+        rect.set_height(count)
+    return grow_ylim(ax3, keyword_counts.max())
+
 def update_chart():
     """Update all live charts with latest analytics data."""
-    # Clear previous state
-    ax1.clear()
-    ax2.clear()
-    ax3.clear()
-
-    # Sentiment Pie Chart
-    labels = ['Positive', 'Neutral', 'Negative']
-    sizes = [sentiment_counts['positive'], 
-             sentiment_counts['neutral'], 
-             sentiment_counts['negative']]
-    ax1.pie(sizes, labels=labels, autopct='%1.1f%%', 
-            colors=['#4CAF50', '#FFEB3B', '#F44336'])
-    ax1.set_title('Real-Time Sentiment Analysis')
-
-    # Message Volume Line Chart
-    if message_timestamps:
-        minutes = [ts.replace(second=0, microsecond=0) for ts in message_timestamps]
-        time_counts = defaultdict(int)
-        for minute in minutes:
-            time_counts[minute] += 1
-        times = sorted(time_counts.keys())
-        counts = [time_counts[t] for t in times]
-        ax2.plot(times, counts, marker='o', linestyle='-', color='#2196F3')
-        ax2.set_title('Message Volume Over Time')
-        ax2.set_ylabel('Messages per Minute')
-        plt.setp(ax2.get_xticklabels(), rotation=45, ha='right')
-
-    # Keyword Frequency Bar Chart
-    if keyword_counts:
-        keywords = list(keyword_counts.keys())
-        counts = list(keyword_counts.values())
-        ax3.bar(keywords, counts, color='#9C27B0')
-        ax3.set_title('Keyword Frequency Tracking')
-        ax3.set_ylabel('Count')
-        plt.setp(ax3.get_xticklabels(), rotation=45, ha='right')
-
-    plt.tight_layout()
-    plt.draw()
-    plt.pause(0.01)
+    update_sentiment_chart()
+    rescaled = update_message_volume()
+    rescaled = update_keyword_chart() or rescaled
+
+    if rescaled or background is None or not fig.canvas.supports_blit:
+        # Axes limits and tick labels changed, so schedule a full redraw
+        # for when the GUI event loop is next idle
+        fig.canvas.draw_idle()
+    else:
+        # Only the data changed, so redraw just the animated artists on the
+        # clean background and push all three charts in a single blit
+        fig.canvas.restore_region(background)
+        draw_animated_artists()
+        fig.canvas.blit(fig.bbox)
 
 #####################################
 # Message Processing Function
 #####################################
 
-def process_message(message: str) -> None:
-    """Process message and update analytics data."""
+@lru_cache(maxsize=4096)
+def _sentiment_label(text: str) -> str:
+    """Classify text as positive, negative, or neutral, caching repeated texts."""
+    compound = sia.polarity_scores(text)['compound']
+    if compound >= 0.05:
+        return 'positive'
+    if compound <= -0.05:
+        return 'negative'
+    return 'neutral'
+
+def _is_word_char(text: str, index: int) -> bool:
+    """Return True if text has a regex word character (\\w) at index."""
+    return 0 <= index < len(text) and (text[index].isalnum() or text[index] == '_')
+
+def process_keywords(message_text: str) -> None:
+    """Count every whole-word keyword occurrence in the message in a single scan."""
+    low = message_text.lower()
+    if not AHOCORASICK_AVAILABLE:
+        for match in _KW_RE.finditer(low):
+            keyword_counts[_KW_IDX[match.group(1)]] += 1
+        return
+
+    for end, (length, index) in _KW_AUTOMATON.iter(low):
+        # Skip matches inside longer words, matching the regex's \b boundaries
+        start = end - length + 1
+        if _is_word_char(low, start - 1) or _is_word_char(low, end + 1):
+            continue
+        keyword_counts[index] += 1
+
+def process_message_volume() -> None:
+    """Count the message in the current minute and drop minutes older than the window."""
+    key = int(time.time() // 60)
+    # If the wall clock stepped backwards, count into the newest minute so
+    # volume_order stays sorted
+    if volume_order and key < volume_order[-1]:
+        key = volume_order[-1]
+    volume_by_min[key] += 1
+    if not volume_order or volume_order[-1] != key:
+        volume_order.append(key)
+    while volume_order[0] <= key - VOLUME_WINDOW_MINUTES:
+        del volume_by_min[volume_order.popleft()]
+
+def deserialize_message(value: bytes):
+    """Decode a raw Kafka message value once, returning None if it is not valid JSON."""
+    try:
+        return orjson.loads(value) if ORJSON_AVAILABLE else json.loads(value)
+    except ValueError:
+        logger.error(f"Invalid JSON message: {value!r}")
+        return None
+
+def process_message_body(msg: dict) -> bool:
+    """Update analytics data from one message without redrawing. Returns True if processed."""
     try:
-        msg = json.loads(message)
         if isinstance(msg, dict):
             message_text = msg.get('message', '')
             
             # Sentiment Analysis
-            scores = sia.polarity_scores(message_text)
-            compound = scores['compound']
-            if compound >= 0.05:
-                sentiment = 'positive'
-            elif compound <= -0.05:
-                sentiment = 'negative'
-            else:
-                sentiment = 'neutral'
-            sentiment_counts[sentiment] += 1
+            # Truncate before the cached call, so VADER never sees very long
+            # inputs and the cache only keeps bounded keys
+            label = _sentiment_label(message_text[:MAX_SENTIMENT_CHARS])
+            sentiment_counts[_SENT_IDX[label]] += 1
 
             # Keyword Tracking
-            clean_text = message_text.lower()
-            for keyword in keywords:
-                if keyword.lower() in clean_text:
-                    keyword_counts[keyword] += 1
+            process_keywords(message_text)
 
             # Message Volume Tracking
-            message_timestamps.append(datetime.now())
+            process_message_volume()
 
-            update_chart()
-            logger.info(f"Processed message: {message_text[:50]}...")
+            logger.info("Processed message: {}...", message_text[:50])
+            return True
+        if msg is not None:  # invalid JSON was already logged when decoded
+            logger.error(f"Expected a dictionary but got: {type(msg)}")
 
     except Exception as e:
         logger.error(f"Error processing message: {str(e)}")
+    return False
+
+def consume_messages(consumer) -> None:
+    """Poll Kafka in batches on a background thread and update analytics data."""
+    global _msgs_since_draw
+    try:
+        while not stop_event.is_set():
+            batches = consumer.poll(timeout_ms=POLL_TIMEOUT_MS, max_records=POLL_MAX_RECORDS)
+            for records in batches.values():
+                for record in records:
+                    with analytics_lock:
+                        if process_message_body(record.value):
+                            _msgs_since_draw += 1
+    except Exception as e:
+        logger.error(f"Error while consuming messages: {e}")
+    finally:
+        consumer.close()
+
+def refresh_charts() -> None:
+    """Redraw the charts on the main thread if new messages arrived since the last redraw."""
+    global _msgs_since_draw
+    with analytics_lock:
+        if not _msgs_since_draw:
+            return
+        _msgs_since_draw = 0
+        # Log errors instead of raising, since an exception would stop the timer
+        try:
+            update_chart()
+        except Exception as e:
+            logger.error(f"Error updating charts: {str(e)}")
 
 #####################################
 # Main Consumer Logic
@@ -158,20 +427,45 @@ def main() -> None:
     """Main entry point for the Kafka consumer."""
     logger.info("Starting real-time analytics consumer")
     
+    # Decode each message value once, as it is fetched
     consumer = create_kafka_consumer(
         get_kafka_topic(),
-        get_kafka_consumer_group_id()
+        get_kafka_consumer_group_id(),
+        value_deserializer_provided=deserialize_message,
+        fetch_min_bytes=get_fetch_min_bytes(),
+        fetch_max_wait_ms=get_fetch_max_wait_ms(),
+        max_poll_records=POLL_MAX_RECORDS,
     )
 
+    # Consume on a background thread so rendering never blocks polling
+    consumer_thread = threading.Thread(target=consume_messages, args=(consumer,), daemon=True)
+    consumer_thread.start()
+
+    # Redraw from a GUI timer so matplotlib is only used on the main thread
+    timer = fig.canvas.new_timer(interval=int(PLOT_INTERVAL_SECONDS * 1000))
+    timer.add_callback(refresh_charts)
+    timer.start()
+
     try:
-        for message in consumer:
-            process_message(message.value)
+        if type(fig.canvas).required_interactive_framework is None:
+            # plt.show() returns at once on non-interactive backends (such as
+            # Agg with no display), so keep consuming until interrupted
+            logger.warning(
+                f"Matplotlib backend '{plt.get_backend()}' is not interactive; "
+                "consuming without live charts"
+            )
+            while consumer_thread.is_alive():
+                consumer_thread.join(timeout=PLOT_INTERVAL_SECONDS)
+        else:
+            # Run the GUI event loop until the window is closed
+            plt.ioff()
+            plt.show()
     except KeyboardInterrupt:
         logger.info("Consumer shutdown requested")
     finally:
-        consumer.close()
-        plt.ioff()
-        plt.show()
+        timer.stop()
+        stop_event.set()
+        consumer_thread.join()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -26,6 +26,10 @@ def create_kafka_consumer(
     topic_provided: str = None,
     group_id_provided: str = None,
     value_deserializer_provided=None,
+    fetch_min_bytes: int = 65536,
+    fetch_max_wait_ms: int = 200,
+    max_poll_records: int = 500,
+    session_timeout_ms: int = 30000,
 ):
     """
     Create and return a Kafka consumer instance.
@@ -34,6 +38,10 @@ def create_kafka_consumer(
         topic_provided (str): The Kafka topic to subscribe to. Defaults to the environment variable or default.
         group_id_provided (str): The consumer group ID. Defaults to the environment variable or default.
         value_deserializer_provided (callable, optional): Function to deserialize message values.
+        fetch_min_bytes (int): Minimum bytes the broker waits to gather before answering a fetch.
+        fetch_max_wait_ms (int): Longest time the broker waits for fetch_min_bytes to gather.
+        max_poll_records (int): Maximum number of records returned by a single poll.
+        session_timeout_ms (int): Time without heartbeats before the consumer is considered dead.
 
     Returns:
         KafkaConsumer: Configured Kafka consumer instance.
@@ -45,6 +53,10 @@ def create_kafka_consumer(
         f"Creating Kafka consumer. Topic='{topic}' and group ID='{group_id_provided}'."
     )
     logger.debug(f"Kafka broker: {kafka_broker}")
+    logger.debug(
+        f"Fetch settings: fetch_min_bytes={fetch_min_bytes}, "
+        f"fetch_max_wait_ms={fetch_max_wait_ms}, max_poll_records={max_poll_records}"
+    )
 
     try:
         consumer = KafkaConsumer(
@@ -55,6 +67,10 @@ def create_kafka_consumer(
             bootstrap_servers=kafka_broker,
             auto_offset_reset="earliest",
             enable_auto_commit=True,
+            fetch_min_bytes=fetch_min_bytes,
+            fetch_max_wait_ms=fetch_max_wait_ms,
+            max_poll_records=max_poll_records,
+            session_timeout_ms=session_timeout_ms,
         )
         logger.info("Kafka consumer created successfully.")
         return consumer